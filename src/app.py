@@ -11,116 +11,139 @@ from fastapi.responses import RedirectResponse
 import os
 from pathlib import Path
 
-app = FastAPI(title="Mergington High School API",
-              description="API for viewing and signing up for extracurricular activities")
-
-# Mount the static files directory
 current_dir = Path(__file__).parent
-app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
-          "static")), name="static")
 
-# In-memory activity database
-activities = {
+# Initial contents of the in-memory activity database
+DEFAULT_ACTIVITIES = {
     "Basketball Team": {
         "description": "Join the basketball team and compete in local tournaments",
         "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
         "max_participants": 15,
-        "participants": []
+        "participants": set()
     },
     "Soccer Club": {
         "description": "Practice soccer skills and participate in matches",
         "schedule": "Tuesdays and Thursdays, 5:00 PM - 7:00 PM",
         "max_participants": 20,
-        "participants": []
+        "participants": set()
     },
     "Art Club": {
         "description": "Explore various art techniques and create projects",
         "schedule": "Fridays, 3:00 PM - 5:00 PM",
         "max_participants": 10,
-        "participants": []
+        "participants": set()
     },
     "Drama Club": {
         "description": "Participate in theater productions and improve acting skills",
         "schedule": "Thursdays, 4:00 PM - 6:00 PM",
         "max_participants": 20,
-        "participants": []
+        "participants": set()
     },
     "Debate Team": {
         "description": "Engage in debates and improve public speaking skills",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": []
+        "participants": set()
     },
     "Math Club": {
         "description": "Solve challenging math problems and participate in competitions",
         "schedule": "Tuesdays, 3:00 PM - 4:30 PM",
         "max_participants": 15,
-        "participants": []
+        "participants": set()
     },
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     }
 }
 
 
-@app.get("/")
-def root():
-    return RedirectResponse(url="/static/index.html")
+def create_app(initial_activities=None):
+    """Create a FastAPI app with its own in-memory activity database"""
+    if initial_activities is None:
+        initial_activities = DEFAULT_ACTIVITIES
+
+    app = FastAPI(title="Mergington High School API",
+                  description="API for viewing and signing up for extracurricular activities")
+
+    # Mount the static files directory
+    app.mount("/static", StaticFiles(directory=os.path.join(current_dir,
+              "static")), name="static")
+
+    # Each app gets its own copy of the activities so instances never share state.
+    # Participants are stored as sets for O(1) membership checks and removal
+    activities = {
+        name: {**details, "participants": set(details["participants"])}
+        for name, details in initial_activities.items()
+    }
+    app.state.activities = activities
+
+    @app.get("/")
+    def root():
+        return RedirectResponse(url="/static/index.html")
+
+    @app.get("/activities")
+    def get_activities():
+        # Sets are not JSON-serializable in a stable order, so emit sorted lists
+        return {
+            name: {**details, "participants": sorted(details["participants"])}
+            for name, details in activities.items()
+        }
 
+    @app.post("/activities/{activity_name}/signup")
+    def signup_for_activity(activity_name: str, email: str):
+        """Sign up a student for an activity"""
+        # Validate activity exists
+        if activity_name not in activities:
+            raise HTTPException(status_code=404, detail="Activity not found")
 
-@app.get("/activities")
-def get_activities():
-    return activities
+        # Get the specific activity
+        activity = activities[activity_name]
 
+        # Validate student is not already signed up
+        if email in activity["participants"]:
+            raise HTTPException(status_code=400, detail="Student already signed up for this activity")
 
-@app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
-    """Sign up a student for an activity"""
-    # Validate activity exists
-    if activity_name not in activities:
-        raise HTTPException(status_code=404, detail="Activity not found")
+        # Add student
+        activity["participants"].add(email)
+        return {"message": f"Signed up {email} for {activity_name}"}
 
-    # Get the specific activity
-    activity = activities[activity_name]
+    @app.delete("/activities/{activity_name}/unregister")
+    def unregister_from_activity(activity_name: str, email: str):
+        """Unregister a student from an activity"""
+        # Validate activity exists
+        if activity_name not in activities:
+            raise HTTPException(status_code=404, detail="Activity not found")
 
-    # Validate student is not already signed up
-    if email in activity["participants"]:
-        raise HTTPException(status_code=400, detail="Student already signed up for this activity")
+        # Get the specific activity
+        activity = activities[activity_name]
 
-    # Add student
-    activity["participants"].append(email)
-    return {"message": f"Signed up {email} for {activity_name}"}
+        # Validate student is signed up
+        if email not in activity["participants"]:
+            raise HTTPException(status_code=400, detail="Student is not signed up for this activity")
 
+        # Remove student
+        activity["participants"].discard(email)
+        return {"message": f"Unregistered {email} from {activity_name}"}
 
-@app.delete("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
-    """Unregister a student from an activity"""
-    # Validate activity exists
-    if activity_name not in activities:
-        raise HTTPException(status_code=404, detail="Activity not found")
+    return app
 
-    # Get the specific activity
-    activity = activities[activity_name]
 
-    # Validate student is signed up
-    if email not in activity["participants"]:
-        raise HTTPException(status_code=400, detail="Student is not signed up for this activity")
+app = create_app()
 
-    # Remove student
-    activity["participants"].remove(email)
-    return {"message": f"Unregistered {email} from {activity_name}"}
+# In-memory activity database of the default app
+activities = app.state.activities
@@ -0,0 +1,54 @@
+"""
+Shared fixtures for Mergington High School API tests
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from src.app import create_app
+from tests.seed_data import canonical_activities
+
+
+@pytest.fixture(scope="session")
+def app_instance():
+    """Create one app per test session (and so per xdist worker)"""
+    return create_app(canonical_activities())
+
+
+@pytest.fixture(scope="session")
+def client(app_instance):
+    """Create a single test client for the FastAPI app, shared by all tests"""
+    with TestClient(app_instance) as c:
+        yield c
+
+
+@pytest.fixture
+def activities(app_instance):
+    """The in-memory activity database backing the test app"""
+    return app_instance.state.activities
+
+
+@pytest.fixture
+def fresh_activities(activities):
+    """Restore activities data after a test that mutates it
+
+    Only tests that change activities request this fixture. The session app
+    starts from the canonical data and every mutating test restores it on
+    teardown, so each test begins from the seed state.
+    """
+    yield activities
+    activities.clear()
+    activities.update(canonical_activities())
+
+
+@pytest.fixture
+def preseed(fresh_activities):
+    """Sign a student up directly in the data, skipping the HTTP round-trip"""
+    def _preseed(activity, email):
+        fresh_activities[activity]["participants"].add(email)
+    return _preseed
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only"""
+    return "asyncio"
@@ -0,0 +1,66 @@
+"""
+Canonical activity seed data shared by the test fixtures and tests
+"""
+
+
+# Original state of the in-memory activity database, stored column-wise as
+# immutable tuples so a reset only allocates the activity dicts and sets
+_NAMES = (
+    "Basketball Team",
+    "Soccer Club",
+    "Art Club",
+    "Drama Club",
+    "Debate Team",
+    "Math Club",
+    "Chess Club",
+    "Programming Class",
+    "Gym Class",
+)
+_DESCS = (
+    "Join the basketball team and compete in local tournaments",
+    "Practice soccer skills and participate in matches",
+    "Explore various art techniques and create projects",
+    "Participate in theater productions and improve acting skills",
+    "Engage in debates and improve public speaking skills",
+    "Solve challenging math problems and participate in competitions",
+    "Learn strategies and compete in chess tournaments",
+    "Learn programming fundamentals and build software projects",
+    "Physical education and sports activities",
+)
+_SCHEDS = (
+    "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
+    "Tuesdays and Thursdays, 5:00 PM - 7:00 PM",
+    "Fridays, 3:00 PM - 5:00 PM",
+    "Thursdays, 4:00 PM - 6:00 PM",
+    "Wednesdays, 3:30 PM - 5:00 PM",
+    "Tuesdays, 3:00 PM - 4:30 PM",
+    "Fridays, 3:30 PM - 5:00 PM",
+    "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+    "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+)
+_MAX = (15, 20, 10, 20, 12, 15, 12, 20, 30)
+_PARTS = (
+    (),
+    (),
+    (),
+    (),
+    (),
+    (),
+    ("michael@mergington.edu", "daniel@mergington.edu"),
+    ("emma@mergington.edu", "sophia@mergington.edu"),
+    ("john@mergington.edu", "olivia@mergington.edu"),
+)
+
+
+def canonical_activities():
+    """Build a fresh activities dict from the canonical seed data"""
+    return {
+        name: {
+            "description": desc,
+            "schedule": sched,
+            "max_participants": max_participants,
+            "participants": set(participants)
+        }
+        for name, desc, sched, max_participants, participants
+        in zip(_NAMES, _DESCS, _SCHEDS, _MAX, _PARTS, strict=True)
+    }
@@ -2,83 +2,34 @@
 Tests for Mergington High School API endpoints
 """
 
+import asyncio
+from urllib.parse import quote
+
+import httpx
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
 
+from src.app import DEFAULT_ACTIVITIES
+from tests.seed_data import canonical_activities
+
+# Endpoint URLs per activity, quoted once at import time
+_ACTIVITY_NAMES = (*DEFAULT_ACTIVITIES, "Nonexistent Activity")
+_SIGNUP = {name: f"/activities/{quote(name)}/signup" for name in _ACTIVITY_NAMES}
+_UNREG = {name: f"/activities/{quote(name)}/unregister" for name in _ACTIVITY_NAMES}
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
 
+def _assert_resp(response, status, detail=None):
+    """Assert the status code, then the error detail only if one is expected"""
+    assert response.status_code == status, response.text
+    if detail is not None:
+        assert response.json()["detail"] == detail
 
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
-    # Store original state
-    original_activities = {
-        "Basketball Team": {
-            "description": "Join the basketball team and compete in local tournaments",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
-            "max_participants": 15,
-            "participants": []
-        },
-        "Soccer Club": {
-            "description": "Practice soccer skills and participate in matches",
-            "schedule": "Tuesdays and Thursdays, 5:00 PM - 7:00 PM",
-            "max_participants": 20,
-            "participants": []
-        },
-        "Art Club": {
-            "description": "Explore various art techniques and create projects",
-            "schedule": "Fridays, 3:00 PM - 5:00 PM",
-            "max_participants": 10,
-            "participants": []
-        },
-        "Drama Club": {
-            "description": "Participate in theater productions and improve acting skills",
-            "schedule": "Thursdays, 4:00 PM - 6:00 PM",
-            "max_participants": 20,
-            "participants": []
-        },
-        "Debate Team": {
-            "description": "Engage in debates and improve public speaking skills",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": []
-        },
-        "Math Club": {
-            "description": "Solve challenging math problems and participate in competitions",
-            "schedule": "Tuesdays, 3:00 PM - 4:30 PM",
-            "max_participants": 15,
-            "participants": []
-        },
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    }
+
+class TestSeedData:
+    """Tests for the canonical test seed data"""
     
-    # Reset activities to original state before each test
-    activities.clear()
-    activities.update(original_activities)
-    yield
-    # Cleanup after test (if needed)
+    def test_seed_matches_app_defaults(self):
+        """Test that the column-wise seed data lines up with the app's defaults"""
+        assert canonical_activities() == DEFAULT_ACTIVITIES
 
 
 class TestRootEndpoint:
@@ -87,7 +38,7 @@ class TestRootEndpoint:
     def test_root_redirects_to_static(self, client):
         """Test that root endpoint redirects to static index.html"""
         response = client.get("/", follow_redirects=False)
-        assert response.status_code == 307
+        _assert_resp(response, 307)
         assert response.headers["location"] == "/static/index.html"
 
 
@@ -97,7 +48,7 @@ class TestGetActivities:
     def test_get_activities_success(self, client):
         """Test getting all activities returns 200 and correct structure"""
         response = client.get("/activities")
-        assert response.status_code == 200
+        _assert_resp(response, 200)
         data = response.json()
         
         # Verify response structure
@@ -130,35 +81,38 @@ class TestGetActivities:
         assert len(data["Chess Club"]["participants"]) == 2
         assert "michael@mergington.edu" in data["Chess Club"]["participants"]
         assert "daniel@mergington.edu" in data["Chess Club"]["participants"]
+        
+        # Participants are serialized as a sorted list
+        assert data["Chess Club"]["participants"] == [
+            "daniel@mergington.edu",
+            "michael@mergington.edu"
+        ]
 
 
+@pytest.mark.usefixtures("fresh_activities")
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_success(self, client):
-        """Test successful signup for an activity"""
-        response = client.post(
-            "/activities/Basketball%20Team/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 200
+    @pytest.mark.parametrize("activity,email,expected_status,expected_detail", [
+        ("Basketball Team", "test@mergington.edu", 200, None),
+        ("Nonexistent Activity", "test@mergington.edu", 404, "Activity not found"),
+        ("Art Club", "test.user+1@mergington.edu", 200, None),
+    ])
+    def test_signup(self, client, activities, activity, email, expected_status,
+                    expected_detail):
+        """Test signup succeeds for valid activities and 404s for unknown ones"""
+        response = client.post(_SIGNUP[activity], params={"email": email})
+        _assert_resp(response, expected_status, expected_detail)
+        if expected_status != 200:
+            return
+        
         data = response.json()
         assert "message" in data
-        assert "test@mergington.edu" in data["message"]
-        assert "Basketball Team" in data["message"]
+        assert email in data["message"]
+        assert activity in data["message"]
         
         # Verify participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "test@mergington.edu" in activities_data["Basketball Team"]["participants"]
-    
-    def test_signup_for_nonexistent_activity(self, client):
-        """Test signup for activity that doesn't exist returns 404"""
-        response = client.post(
-            "/activities/Nonexistent%20Activity/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert data["detail"] == "Activity not found"
+        assert email in activities[activity]["participants"]
     
     def test_signup_duplicate_student(self, client):
         """Test that signing up the same student twice fails"""
@@ -166,99 +120,63 @@ class TestSignupForActivity:
         activity = "Soccer Club"
         
         # First signup should succeed
-        response1 = client.post(
-            f"/activities/{activity}/signup?email={email}"
-        )
-        assert response1.status_code == 200
+        response1 = client.post(_SIGNUP[activity], params={"email": email})
+        _assert_resp(response1, 200)
         
         # Second signup should fail
-        response2 = client.post(
-            f"/activities/{activity}/signup?email={email}"
-        )
-        assert response2.status_code == 400
-        data = response2.json()
-        assert data["detail"] == "Student already signed up for this activity"
-    
-    def test_signup_with_special_characters_in_email(self, client):
-        """Test signup with special characters in email"""
-        response = client.post(
-            "/activities/Art%20Club/signup?email=test.user%2B1%40mergington.edu"
-        )
-        assert response.status_code == 200
+        response2 = client.post(_SIGNUP[activity], params={"email": email})
+        _assert_resp(response2, 400, "Student already signed up for this activity")
 
 
+@pytest.mark.usefixtures("fresh_activities")
 class TestUnregisterFromActivity:
     """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
     
-    def test_unregister_success(self, client):
+    def test_unregister_success(self, client, activities, preseed):
         """Test successful unregistration from an activity"""
-        # First, sign up a student
+        # First, seed a signed-up student directly in the data
         email = "test@mergington.edu"
         activity = "Drama Club"
-        client.post(f"/activities/{activity}/signup?email={email}")
+        preseed(activity, email)
         
         # Then unregister
-        response = client.delete(
-            f"/activities/{activity}/unregister?email={email}"
-        )
-        assert response.status_code == 200
+        response = client.delete(_UNREG[activity], params={"email": email})
+        _assert_resp(response, 200)
         data = response.json()
         assert "message" in data
         assert email in data["message"]
         assert activity in data["message"]
         
         # Verify participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data[activity]["participants"]
+        assert email not in activities[activity]["participants"]
     
-    def test_unregister_existing_participant(self, client):
-        """Test unregistering a pre-existing participant"""
-        email = "michael@mergington.edu"
-        activity = "Chess Club"
-        
-        # Verify student is initially in the activity
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity]["participants"]
-        
-        # Unregister
-        response = client.delete(
-            f"/activities/{activity}/unregister?email={email}"
-        )
-        assert response.status_code == 200
+    @pytest.mark.parametrize("activity,email,expected_status,expected_detail", [
+        ("Chess Club", "michael@mergington.edu", 200, None),
+        ("Nonexistent Activity", "test@mergington.edu", 404, "Activity not found"),
+        ("Math Club", "notsignedup@mergington.edu", 400,
+         "Student is not signed up for this activity"),
+    ])
+    def test_unregister(self, client, activities, activity, email, expected_status,
+                        expected_detail):
+        """Test unregistering pre-existing participants and the error cases"""
+        if expected_status == 200:
+            # Verify student is initially in the activity
+            assert email in activities[activity]["participants"]
+        
+        response = client.delete(_UNREG[activity], params={"email": email})
+        _assert_resp(response, expected_status, expected_detail)
+        if expected_status != 200:
+            return
         
         # Verify participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data[activity]["participants"]
-    
-    def test_unregister_from_nonexistent_activity(self, client):
-        """Test unregister from activity that doesn't exist returns 404"""
-        response = client.delete(
-            "/activities/Nonexistent%20Activity/unregister?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert data["detail"] == "Activity not found"
-    
-    def test_unregister_student_not_signed_up(self, client):
-        """Test unregistering a student who is not signed up fails"""
-        email = "notsignedup@mergington.edu"
-        activity = "Math Club"
-        
-        response = client.delete(
-            f"/activities/{activity}/unregister?email={email}"
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["detail"] == "Student is not signed up for this activity"
+        assert email not in activities[activity]["participants"]
 
 
+@pytest.mark.usefixtures("fresh_activities")
 class TestIntegrationScenarios:
     """Integration tests for common user scenarios"""
     
-    def test_complete_signup_and_unregister_flow(self, client):
+    def test_complete_signup_and_unregister_flow(self, client, activities):
         """Test complete flow: get activities, signup, verify, unregister, verify"""
         email = "integration@mergington.edu"
         activity = "Debate Team"
@@ -269,31 +187,26 @@ class TestIntegrationScenarios:
         initial_count = len(initial_data[activity]["participants"])
         
         # 2. Sign up
-        signup_response = client.post(
-            f"/activities/{activity}/signup?email={email}"
-        )
-        assert signup_response.status_code == 200
+        signup_response = client.post(_SIGNUP[activity], params={"email": email})
+        _assert_resp(signup_response, 200)
         
         # 3. Verify signup
-        response = client.get("/activities")
-        data = response.json()
-        assert email in data[activity]["participants"]
-        assert len(data[activity]["participants"]) == initial_count + 1
+        participants = activities[activity]["participants"]
+        assert email in participants
+        assert len(participants) == initial_count + 1
         
         # 4. Unregister
-        unregister_response = client.delete(
-            f"/activities/{activity}/unregister?email={email}"
-        )
-        assert unregister_response.status_code == 200
+        unregister_response = client.delete(_UNREG[activity], params={"email": email})
+        _assert_resp(unregister_response, 200)
         
         # 5. Verify unregistration
-        response = client.get("/activities")
-        data = response.json()
-        assert email not in data[activity]["participants"]
-        assert len(data[activity]["participants"]) == initial_count
+        participants = activities[activity]["participants"]
+        assert email not in participants
+        assert len(participants) == initial_count
     
-    def test_multiple_students_signup(self, client):
-        """Test multiple students signing up for the same activity"""
+    @pytest.mark.anyio
+    async def test_multiple_students_signup(self, app_instance, activities):
+        """Test multiple students signing up for the same activity concurrently"""
         activity = "Programming Class"
         emails = [
             "student1@mergington.edu",
@@ -301,14 +214,15 @@ class TestIntegrationScenarios:
             "student3@mergington.edu"
         ]
         
-        for email in emails:
-            response = client.post(
-                f"/activities/{activity}/signup?email={email}"
-            )
-            assert response.status_code == 200
+        transport = httpx.ASGITransport(app=app_instance)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            responses = await asyncio.gather(*[
+                ac.post(_SIGNUP[activity], params={"email": email})
+                for email in emails
+            ])
+        for response in responses:
+            _assert_resp(response, 200)
         
         # Verify all students are registered
-        response = client.get("/activities")
-        data = response.json()
         for email in emails:
-            assert email in data[activity]["participants"]
+            assert email in activities[activity]["participants"]